@@ -1,15 +1,31 @@
 import requests
-import pandas as pd
+import orjson
 import time
 import json
+import logging
 import os
-from os.path import exists
+import queue
+import sys
+import atexit
+import shelve
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from itertools import dropwhile, takewhile
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, Timeout, RequestException
-from openpyxl import load_workbook
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils import column_index_from_string, get_column_letter
-from openpyxl.styles import Alignment, Font
+from openpyxl.styles import Alignment, Color, Font, NamedStyle
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 # GitHub Personal Access Token
 GITHUB_TOKEN = os.environ.get('JH_TOKEN')
 if not GITHUB_TOKEN:
@@ -21,177 +37,492 @@ headers = {
     'Accept': 'application/vnd.github.v3+json'
 }
 
-CACHE_FILE = "pr_cache.json"
+# Shared session so connections to api.github.com are kept alive and pooled
+MAX_WORKERS = 8
+SESSION = requests.Session()
+SESSION.headers.update(headers)  # 인증/Accept 헤더는 세션이 모든 요청에 붙임
+SESSION.verify = True  # 기본값이지만 요청마다 따로 넘기지 않도록 세션에 고정
+
+class GitHubRetry(Retry):
+    """Retry policy that hands exhausted rate limits back to github_request instead of retrying."""
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        # Remaining: 0이면 리셋 전까지 몇 번을 다시 보내도 거절됨 -> 바로 응답을 돌려줘서
+        # github_request가 리셋 시각까지 기다리게 함 (raise_on_status=False라 예외 대신 응답이 반환됨)
+        if response is not None and response.headers.get('X-RateLimit-Remaining') == '0':
+            raise MaxRetryError(_pool, url, ResponseError('rate limit exhausted'))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+# 일시적인 서버 오류와 429(보조 rate limit)는 urllib3가 Retry-After를 지키면서 재시도
+# (GraphQL 조회도 멱등이므로 POST까지 재시도)
+# 재시도를 다 써도 RetryError 대신 마지막 응답을 돌려줌 -> 호출하는 쪽의 raise_for_status가 처리
+RETRY_POLICY = GitHubRetry(
+    total=5, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504],
+    allowed_methods=frozenset(['GET', 'POST']), respect_retry_after_header=True,
+    raise_on_status=False
+)
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=RETRY_POLICY))
+
+def parse_json(response):
+    """Decode a response body with orjson, raising the same error type as response.json()."""
+    # response.json()보다 훨씬 빠름. 다만 orjson.JSONDecodeError는 RequestException이 아니므로
+    # requests의 JSONDecodeError로 바꿔서 기존 except RequestException 처리에 걸리게 함
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+class RateLimiter:
+    """
+    Pace requests using the X-RateLimit-* headers GitHub returns on every response.
+
+    GitHub keeps separate budgets per resource ('core', 'search', 'graphql'), so each one
+    is tracked on its own. All worker threads share one instance.
+    """
+
+    def __init__(self, threshold=5, pacing_threshold=50, thresholds=None):
+        self.threshold = threshold  # 이보다 적게 남으면 리셋까지 대기
+        self.thresholds = thresholds or {}  # resource별 threshold (없으면 기본값)
+        self.pacing_threshold = pacing_threshold  # 이보다 적게 남으면 남은 요청을 고르게 분산
+        self.lock = threading.Lock()
+        self.limits = {}  # resource -> [remaining, reset_time, next_send_time]
+
+    def update(self, response):
+        """Record the remaining budget reported by a response."""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset_time = response.headers.get('X-RateLimit-Reset')
+        if remaining is None or reset_time is None:
+            return
+        resource = response.headers.get('X-RateLimit-Resource', 'core')
+        with self.lock:
+            limit = self.limits.get(resource)
+            next_send_time = limit[2] if limit else 0  # 이미 예약된 전송 시각은 유지
+            self.limits[resource] = [int(remaining), int(reset_time), next_send_time]
+
+    def acquire(self, resource='core'):
+        """Block until a request against the given resource may be sent."""
+        # lock 안에서는 언제 보낼지만 정하고, 실제 대기는 lock을 놓은 뒤에 함
+        # (한 resource가 바닥나도 다른 resource의 요청과 update()는 막히지 않음)
+        with self.lock:
+            limit = self.limits.get(resource)
+            now = time.time()
+            if limit is None or now >= limit[1]:
+                return  # 아직 모르거나 이미 리셋됨
+            if limit[0] < self.thresholds.get(resource, self.threshold):
+                send_time = limit[1] + 1  # 리셋 이후로 미룸
+                logger.warning(f"Rate limit nearing for '{resource}'. Sleeping for {int(send_time - now)} seconds...")
+            else:
+                limit[0] -= 1  # 응답이 오기 전에 다른 스레드가 같은 예산을 쓰지 않도록 미리 차감
+                send_time = now
+                if limit[0] < self.pacing_threshold:
+                    # 스레드마다 전송 시각을 하나씩 예약해서, 여러 스레드가 같은 순간에 몰려 보내지 않게 함
+                    send_time = max(now, limit[2])
+                    limit[2] = send_time + (limit[1] - now) / (limit[0] + 1)
+        if send_time > now:
+            time.sleep(send_time - now)
+
+# 검색 API는 분당 30회뿐이라 기본 threshold(10)를 쓰면 예산의 1/3이 버려짐
+rate_limiter = RateLimiter(threshold=10, thresholds={'search': 2})
+
+def _record_rate_limit(response, *args, **kwargs):
+    """Session response hook: feed every response's rate-limit headers to the limiter."""
+    rate_limiter.update(response)
+
+# 세션 응답 훅에서 한 곳에서만 갱신 (세션으로 보내는 모든 요청에 적용)
+SESSION.hooks['response'].append(_record_rate_limit)
+
+def github_request(method, url, resource='core', **kwargs):
+    """Send a request on the shared session, waiting out rate-limit rejections."""
+    while True:
+        rate_limiter.acquire(resource)
+        response = SESSION.request(method, url, **kwargs)  # 남은 한도는 세션 훅이 기록
+        # 한도를 다 쓰면 403(또는 429)과 Remaining: 0이 옴 -> 리셋까지 기다렸다가 다시 요청
+        if response.status_code in (403, 429) and response.headers.get('X-RateLimit-Remaining') == '0':
+            reset_time = int(response.headers.get('X-RateLimit-Reset', time.time()))
+            sleep_duration = max(1, reset_time - time.time() + 1)
+            logger.warning(f"Rate limit exceeded. Waiting for {int(sleep_duration)} seconds.")
+            time.sleep(sleep_duration)
+            continue
+        return response
+
+def _is_graphql_rate_limited(response):
+    """Check whether a GraphQL response was rejected with a RATE_LIMITED error."""
+    if response.status_code != 200:
+        return False
+    try:
+        errors = parse_json(response).get('errors') or []
+    except (RequestException, AttributeError):
+        return False  # 본문 오류는 호출하는 쪽에서 처리
+    return any(error.get('type') == 'RATE_LIMITED' for error in errors)
+
+def graphql_request(payload, **kwargs):
+    """POST a GraphQL payload, encoding the body with orjson and waiting out RATE_LIMITED errors."""
+    # requests의 json=은 표준 json으로 직렬화하므로 orjson으로 직접 만든 body를 보냄
+    body = orjson.dumps(payload)
+    while True:
+        response = github_request('POST', GRAPHQL_URL, resource='graphql', data=body,
+                                  headers={'Content-Type': 'application/json'}, **kwargs)
+        # GraphQL은 한도를 넘어도 200으로 오고 errors에 RATE_LIMITED가 들어 있음
+        # -> github_request의 403 처리처럼 리셋까지 기다렸다가 다시 요청
+        if not _is_graphql_rate_limited(response):
+            return response
+        reset_time = int(response.headers.get('X-RateLimit-Reset', time.time()))
+        sleep_duration = max(1, reset_time - time.time() + 1)
+        logger.warning(f"GraphQL rate limit exceeded. Waiting for {int(sleep_duration)} seconds.")
+        time.sleep(sleep_duration)
+
+CACHE_FILE = "pr_cache.db"
+cache_lock = threading.Lock()  # 여러 스레드에서 pr_cache를 사용하므로 필요
+# 사용자 ID 캐시 키 (저장소 이름에는 @가 들어갈 수 없어 저장소 항목과 겹치지 않음)
+USER_ID_CACHE_KEY = "@user_ids"
+
+# Excel output columns
+COLUMNS = ['No.', 'Repository', 'PR Title',
+           'PR No.', 'PR Open Time', 'PR Close Time',
+           'Merge days', 'LOC', 'PR Status']
+MAX_COLUMN_WIDTH = 80
+
+# 스타일 객체는 한 번만 만들어 모든 셀이 공유 (셀마다 새로 만들지 않음)
+HEADER_FONT = Font(bold=True)
+CENTER_STYLE = NamedStyle(name='PR Center', alignment=Alignment(horizontal='center'))
+LEFT_STYLE = NamedStyle(name='PR Left', alignment=Alignment(horizontal='left'))
+LINK_STYLE = NamedStyle(
+    name='PR Link',
+    font=Font(underline='single', color=Color(theme=10)),  # same look as the built-in 'Hyperlink' style
+    alignment=Alignment(horizontal='center')
+)
+DATETIME_STYLE = NamedStyle(
+    name='PR Datetime', number_format='yyyy-mm-dd hh:mm:ss', alignment=Alignment(horizontal='center')
+)
+COLUMN_STYLES = [CENTER_STYLE, LEFT_STYLE, LEFT_STYLE, LINK_STYLE,
+                 DATETIME_STYLE, DATETIME_STYLE, CENTER_STYLE, CENTER_STYLE, CENTER_STYLE]
+
+# PR list fields used by the report; everything else is dropped right after parsing
+PR_FIELDS = ('number', 'title', 'html_url', 'user', 'created_at', 'closed_at', 'merged_at')
+
+# 개수가 같더라도 PR 상태(merge/close)는 바뀔 수 있으므로 목록 재사용은 하루까지만
+PR_LIST_MAX_AGE = 24 * 60 * 60  # seconds
+# 한 시간 안에 확인한 PR 개수는 검색 API를 다시 부르지 않고 그대로 사용
+PR_COUNT_MAX_AGE = 60 * 60  # seconds
+
+GRAPHQL_URL = 'https://api.github.com/graphql'
+GRAPHQL_BATCH_SIZE = 50  # PRs per GraphQL query (node limit 여유있게)
+GRAPHQL_USER_BATCH_SIZE = 100  # users per GraphQL query
 
 # Load cache
 def load_cache():
-    if exists(CACHE_FILE):
-        with open(CACHE_FILE, "r") as file:
-            return json.load(file)
-    return {}
+    # 저장소 이름을 키로 하는 shelve(dbm) 파일: 전체 파일을 다시 쓰지 않고 해당 키만 읽고 씀
+    try:
+        return shelve.open(CACHE_FILE, writeback=False)
+    except Exception as e:
+        # 실행 도중 종료 등으로 캐시 파일이 깨졌으면 버리고 새로 만듦 (캐시는 다시 받으면 됨)
+        logger.warning(f"Cache file '{CACHE_FILE}' is unreadable ({e}). Starting with an empty cache.")
+        return shelve.open(CACHE_FILE, flag='n', writeback=False)
 
-# Save cache
-def save_cache(cache):
-    with open(CACHE_FILE, "w") as file:
-        json.dump(cache, file)
+def _read_cache_entry(key):
+    """Return a cached entry as a dict, treating unreadable entries as missing (call with cache_lock held)."""
+    try:
+        entry = pr_cache.get(key)
+    except Exception as e:
+        logger.warning(f"Discarding unreadable cache entry '{key}': {e}")
+        return {}
+    return entry if isinstance(entry, dict) else {}
 
 pr_cache = load_cache()
+atexit.register(pr_cache.close)
+
+def get_repo_cache(repo_name):
+    """Return the cache entry for a repository (empty dict if not cached yet)."""
+    with cache_lock:
+        return _read_cache_entry(repo_name)
+
+def update_repo_cache(repo_name, **fields):
+    """Merge fields into a repository's cache entry and write it back."""
+    with cache_lock:
+        entry = _read_cache_entry(repo_name)
+        entry.update(fields)
+        pr_cache[repo_name] = entry  # writeback=False이므로 다시 대입해야 저장됨
+
+def get_cached_user_ids():
+    """Return the login -> user ID mapping saved by earlier runs."""
+    with cache_lock:
+        return _read_cache_entry(USER_ID_CACHE_KEY)
+
+def update_cached_user_ids(user_ids):
+    """Merge newly resolved user IDs into the cache."""
+    with cache_lock:
+        entry = _read_cache_entry(USER_ID_CACHE_KEY)
+        entry.update(user_ids)
+        pr_cache[USER_ID_CACHE_KEY] = entry
 
 def get_rate_limit():
     """Fetch GitHub API rate limit."""
     rate_limit_url = 'https://api.github.com/rate_limit'
-    rate_limit_response = requests.get(rate_limit_url, headers=headers)
-    print(json.dumps(rate_limit_response.json(), indent=2))
-
-def ensure_rate_limit():
-    rate_limit_url = 'https://api.github.com/rate_limit'
-    response = requests.get(rate_limit_url, headers=headers)
-    rate_limit_data = response.json()
-
-    remaining = rate_limit_data['rate']['remaining']    # 남은 요청 수
-    reset_time = rate_limit_data['rate']['reset']   # 리셋 시간 
-
-    if remaining == 0:
-        # 요청이 초과되었을 경우, 리셋 될 때 까지 대기
-        wait_time = reset_time - int(time.time())
-        print(f"Rate limit exceeded. Waiting for {wait_time} seconds.")
-        time.sleep(wait_time + 1)
+    rate_limit_response = SESSION.get(rate_limit_url)
+    # 보기 좋게 출력하는 용도로만 json 사용
+    logger.info(json.dumps(parse_json(rate_limit_response), indent=2))
 
 def get_user_id(username):
     """Fetch the user ID from GitHub API based on username."""
-    ensure_rate_limit()
     url = f'https://api.github.com/users/{username}'
-    response = requests.get(url, headers=headers)
+    response = github_request('GET', url)
     
     if response.status_code == 200:
-        user_info = response.json()
+        try:
+            user_info = parse_json(response)
+        except RequestException as e:
+            logger.error(f"Error fetching user info for {username}: {e}")
+            return None
         return user_info['id']  # Get the unique user ID
     else:
-        print(f"Error fetching user info for {username}")
+        logger.error(f"Error fetching user info for {username}")
         return None
     
-def get_repositories_from_excel(repo_excel_path, repo_sheet_name, column_letter):
-    """Load repositories from the Excel file's specified column."""
+def get_user_ids(usernames):
+    """Fetch user IDs for many usernames with batched GraphQL queries."""
+    # 사용자 ID는 바뀌지 않으므로 이전 실행에서 찾은 것은 다시 묻지 않음
+    cached_ids = get_cached_user_ids()
+    user_ids = {login: cached_ids[login] for login in usernames if login in cached_ids}
+    missing = [login for login in usernames if login not in cached_ids]
+
+    for i in range(0, len(missing), GRAPHQL_USER_BATCH_SIZE):
+        batch = missing[i:i + GRAPHQL_USER_BATCH_SIZE]
+        # 사용자마다 alias 하나씩 (json.dumps로 login 문자열을 안전하게 인용)
+        fields = ' '.join(f'u{j}:user(login:{json.dumps(str(login))}){{databaseId}}' for j, login in enumerate(batch))
+        try:
+            response = graphql_request({'query': f'query{{{fields}}}'}, timeout=30)
+            response.raise_for_status()
+            result = parse_json(response)
+            users = result.get('data') or {}
+            # GraphQL이 없는 사용자라고 확실히 답한 alias는 REST로 다시 묻지 않음
+            not_found = {error['path'][0] for error in result.get('errors') or []
+                         if error.get('type') == 'NOT_FOUND' and error.get('path')}
+        except RequestException as e:
+            logger.warning(f"Failed to fetch user IDs via GraphQL: {e}")
+            users = {}
+            not_found = set()
+
+        for j, login in enumerate(batch):
+            user = users.get(f'u{j}')
+            if user:
+                user_ids[login] = user['databaseId']
+            elif f'u{j}' in not_found:
+                logger.error(f"Error fetching user info for {login}")
+            else:
+                # GraphQL 요청 자체가 실패한 경우 등만 REST로 다시 확인
+                user_id = get_user_id(login)
+                if user_id:
+                    user_ids[login] = user_id
+
+    update_cached_user_ids({login: user_ids[login] for login in missing if login in user_ids})
+    return user_ids
+
+@lru_cache(maxsize=8)
+def _load_repositories(repo_excel_path, mtime, repo_sheet_name, column_letter):
+    """Read the repository column once per (path, mtime, sheet, column)."""
+    # read-only 모드: 시트 전체 객체를 만들지 않고 행을 스트리밍으로 읽음
+    wb = load_workbook(repo_excel_path, read_only=True, data_only=True)
     try:
-        wb = load_workbook(repo_excel_path)
         ws = wb[repo_sheet_name]
 
         repos = []
-        column_index = column_index_from_string(column_letter) - 1
+        column_index = column_index_from_string(column_letter)
 
-        for row in ws.iter_rows(min_row=2, values_only=True):  # No header # Skip header row
-            repo_name = row[column_index]
-            print(f"Repo name: '{repo_name}'")
+        # 필요한 열만 읽음 (다른 열의 셀 값은 만들지 않음)
+        for (repo_name,) in ws.iter_rows(min_row=2, min_col=column_index, max_col=column_index,
+                                         values_only=True):  # No header # Skip header row
+            logger.debug(f"Repo name: '{repo_name}'")
             if repo_name and repo_name.strip():
                 repos.append(repo_name.strip())  # 이름 정리
             else:
-                print("Skipping empty repository name")
+                logger.debug("Skipping empty repository name")
+    finally:
+        wb.close()  # read-only 모드는 파일 핸들을 계속 잡고 있으므로 직접 닫아야 함
+
+    logger.info(f"Found {len(repos)} repositories.")
+    return tuple(repos)
 
-        print(f"Found {len(repos)} repositories.")
-        return repos
+def get_repositories_from_excel(repo_excel_path, repo_sheet_name, column_letter):
+    """Load repositories from the Excel file's specified column."""
+    try:
+        mtime = os.path.getmtime(repo_excel_path)  # 파일이 바뀌면 캐시도 무효화
+        return list(_load_repositories(repo_excel_path, mtime, repo_sheet_name, column_letter))
     except FileNotFoundError:
-        print(f"Error: File not found at {repo_excel_path}")
+        logger.error(f"Error: File not found at {repo_excel_path}")
         return []
     except KeyError:
-        print(f"Error: Sheet '{repo_sheet_name}' not found in the Excel file.")
+        logger.error(f"Error: Sheet '{repo_sheet_name}' not found in the Excel file.")
         return []
     except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+        logger.error(f"An unexpected error occurred: {e}")
         return []
 
-def get_contributors_from_excel(repo_excel_path, contributor_sheet_name, column_letter):
-    """Load contributors from the Excel file's specified column."""
-    print(f"Loading contributors from Excel file '{repo_excel_path}', sheet '{contributor_sheet_name}'...")
-    wb = load_workbook(repo_excel_path)
-    ws = wb[contributor_sheet_name]
+@lru_cache(maxsize=8)
+def _load_contributors(repo_excel_path, mtime, contributor_sheet_name, column_letter):
+    """Read the contributor column once per (path, mtime, sheet, column)."""
+    logger.info(f"Loading contributors from Excel file '{repo_excel_path}', sheet '{contributor_sheet_name}'...")
+    wb = load_workbook(repo_excel_path, read_only=True, data_only=True)
+    try:
+        ws = wb[contributor_sheet_name]
 
-    contributors = []
-    column_index = column_index_from_string(column_letter) - 1
+        contributors = []
+        column_index = column_index_from_string(column_letter)
 
-    for row in ws.iter_rows(min_row=2, values_only=True):  # Skip header row
-        contributor_name = row[column_index]
-        if contributor_name:
-            contributors.append(contributor_name)
-        else:
-            print("Skipping empty contributor name")
+        for (contributor_name,) in ws.iter_rows(min_row=2, min_col=column_index, max_col=column_index,
+                                                values_only=True):  # Skip header row
+            if contributor_name:
+                contributors.append(contributor_name)
+            else:
+                logger.debug("Skipping empty contributor name")
+    finally:
+        wb.close()
 
-    print(f"Found {len(contributors)} contributors.")
-    return contributors
+    logger.info(f"Found {len(contributors)} contributors.")
+    return tuple(contributors)
 
-def get_prs_for_repository(repo_name):
-    """Fetch PRs for a given repository."""
-    print(f"Fetching PR list for repository '{repo_name}'...")
-    all_prs = []
-    page = 1
+def get_contributors_from_excel(repo_excel_path, contributor_sheet_name, column_letter):
+    """Load contributors from the Excel file's specified column."""
+    mtime = os.path.getmtime(repo_excel_path)  # 파일이 바뀌면 캐시도 무효화
+    return list(_load_contributors(repo_excel_path, mtime, contributor_sheet_name, column_letter))
+
+def _project_pr(pr):
+    """Keep only the PR fields the report uses (the author is reduced to its ID)."""
+    projected = {key: pr[key] for key in PR_FIELDS}
+    # user 객체에도 URL 등 20개 가까운 필드가 있지만 작성자 ID만 사용 (탈퇴한 사용자는 null)
+    if projected['user']:
+        projected['user'] = {'id': projected['user']['id']}
+    return projected
+
+def get_prs_for_repository(repo_name, start_date=None, pr_count=None):
+    """
+    Fetch PRs for a given repository, newest first.
 
-    while True:
-        url = f'https://api.github.com/repos/AdvancedTechnologyInc/{repo_name}/pulls?state=all&per_page=100&page={page}'
+    Pagination stops at the first page that reaches PRs created before start_date
+    ('YYYY-MM-DD'), since every later page is older still. pr_count is the PR count
+    the list is fetched against; it is cached with the pages for is_pr_list_fresh.
+    """
+    logger.info(f"Fetching PR list for repository '{repo_name}'...")
+    all_prs = []
+    repo_cache = get_repo_cache(repo_name)
+    cached_pages = repo_cache.get('pages', [])
+    pages = []
+    # 다음 페이지가 있을 때만 GitHub가 Link 헤더에 rel="next"를 줌 -> 빈 페이지를 한 번 더 요청하지 않음
+    url = f'https://api.github.com/repos/AdvancedTechnologyInc/{repo_name}/pulls?state=all&sort=created&direction=desc&per_page=100'
+
+    while url:
+        page = len(pages) + 1
+        cached_page = cached_pages[page - 1] if page <= len(cached_pages) else None
+        request_headers = {}
+        # 304 응답에는 Link 헤더가 없을 수 있으므로 다음 페이지 URL까지 저장된 페이지만 재검증에 사용
+        if cached_page and cached_page.get('etag') and 'next' in cached_page:
+            # 변경이 없으면 304가 오고 rate limit도 차감되지 않음
+            request_headers['If-None-Match'] = cached_page['etag']
         try:
-            ensure_rate_limit()
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()  # Raise an exception for bad responses
-
-            #check remaining rate limit
-            remaining_limit = int(response.headers.get('X-RateLimit-Remaining', 1))
-            if remaining_limit < 5:
-                reset_time = int(response.headers.get('X-RateLimit-Reset', time.time()))
-                sleep_duration = max(0, reset_time - int(time.time()))
-                print(f"Rate limit nearing. Sleeping for {sleep_duration} seconds...")
-                time.sleep(sleep_duration + 1)
-            
-            prs = response.json()
-            if not prs:
-                break
-            print(f"Found {len(prs)} PRs on page {page}.")
+            response = github_request('GET', url, headers=request_headers, timeout=10)
+            if response.status_code == 304:
+                prs = cached_page['prs']
+                etag = cached_page['etag']
+                next_url = cached_page['next']
+            else:
+                response.raise_for_status()  # Raise an exception for bad responses
+
+                # 필요한 필드만 남기고 나머지(base, head, _links ...)는 바로 버림
+                prs = [_project_pr(pr) for pr in parse_json(response)]
+                etag = response.headers.get('ETag')
+                next_url = response.links.get('next', {}).get('url')
+            pages.append({'etag': etag, 'prs': prs, 'next': next_url})
+            logger.debug(f"Found {len(prs)} PRs on page {page}.")
             all_prs.extend(prs)
-            page += 1
-            time.sleep(2)  # 2초 대기 후 다음 요청
+            # GitHub 시간은 ISO-8601(UTC) 고정 형식이라 문자열 비교로 충분
+            if start_date and prs and prs[-1]['created_at'] < start_date:
+                break  # 이후 페이지는 모두 시작일 이전 PR
+            url = next_url
         except RequestException as e:
-            print(f"Error fetching PR list for repository '{repo_name}': {e}")
-            break
-        
+            logger.error(f"Error fetching PR list for repository '{repo_name}': {e}")
+            return all_prs  # 중간에 실패한 목록은 캐시하지 않음
+
+    update_repo_cache(repo_name, pages=pages, list_count=pr_count, last_fetched=time.time(), start_date=start_date)
     return all_prs
 
-def get_pr_details(repo_name, pr_number):
-    """Fetch the details for a specific PR."""
-    pr_detail_url = f"https://api.github.com/repos/AdvancedTechnologyInc/{repo_name}/pulls/{pr_number}"
+def get_cached_prs(repo_cache):
+    """Return the PRs stored in a repository's cached list pages."""
+    return [pr for page in repo_cache['pages'] for pr in page['prs']]
+
+def is_pr_list_fresh(repo_cache, pr_count, start_date=None):
+    """Check whether a repository's cached PR list can be reused without fetching it again."""
+    # get_pr_count가 'count'를 먼저 갱신하므로, 목록을 실제로 받았을 때의 개수(list_count)와 비교
+    # (개수 확인 후 목록 요청이 실패해도 예전 목록이 새 개수와 맞는 것으로 보이지 않게)
+    if not repo_cache.get('pages') or repo_cache.get('list_count') != pr_count:
+        return False
+    if time.time() - repo_cache.get('last_fetched', 0) >= PR_LIST_MAX_AGE:
+        return False
+    # 캐시된 목록이 요청한 시작일까지 포함하는지 확인 (start_date가 None이면 전체 목록)
+    if 'start_date' not in repo_cache:
+        return False
+    cached_start_date = repo_cache['start_date']
+    return cached_start_date is None or (start_date is not None and cached_start_date <= start_date)
+
+def fetch_pr_stats_batch(repo_name, batch):
+    """Fetch additions + deletions for one batch of PRs in a single GraphQL query."""
+    # PR 번호마다 alias 하나씩 붙여서 한 번의 요청으로 조회
+    fields = ' '.join(f'pr{n}:pullRequest(number:{n}){{additions deletions}}' for n in batch)
+    query = f'query($o:String!,$r:String!){{repository(owner:$o,name:$r){{{fields}}}}}'
+    payload = {'query': query, 'variables': {'o': 'AdvancedTechnologyInc', 'r': repo_name}}
     try:
-        pr_detail_response = requests.get(pr_detail_url, headers=headers)
-        pr_detail_response.raise_for_status()  # Raise error for bad responses
-
-        # Check rate limit
-        remaining_limit = int(pr_detail_response.headers.get('X-RateLimit-Remaining', 1))
-        if remaining_limit < 5:
-            reset_time = int(pr_detail_response.headers.get('X-RateLimit-Reset', time.time()))
-            sleep_duration = max(0, reset_time - int(time.time()))
-            print(f"Rate limit nearing. Sleeping for {sleep_duration} seconds...")
-            time.sleep(sleep_duration + 1)
-
-        pr_details = pr_detail_response.json()
-        additions = pr_details.get('additions', 0)
-        deletions = pr_details.get('deletions', 0)
-        total_changes = additions + deletions
-        return total_changes
+        response = graphql_request(payload, timeout=30)
+        response.raise_for_status()
+
+        result = parse_json(response)
+        # 200이어도 timeout 등으로 data가 null이거나 일부만 올 수 있으므로 errors를 남김
+        for error in result.get('errors') or []:
+            logger.warning(f"GraphQL error while fetching PR stats for repository '{repo_name}': "
+                           f"{error.get('type', 'ERROR')}: {error.get('message')}")
+        repository = (result.get('data') or {}).get('repository') or {}
+        pr_stats = {}
+        for pr_number in batch:
+            pr = repository.get(f'pr{pr_number}')
+            pr_stats[pr_number] = pr['additions'] + pr['deletions'] if pr else 'N/A'
+        return pr_stats
     except RequestException as e:
-        print(f"Failed to fetch details for PR #{pr_number}: {e}")
-        return 'N/A'
+        logger.error(f"Failed to fetch PR stats for repository '{repo_name}': {e}")
+        return {pr_number: 'N/A' for pr_number in batch}
+
+def fetch_pr_stats_graphql(repo_name, pr_numbers):
+    """Fetch additions + deletions for many PRs, one GraphQL batch after another."""
+    # 이미 main의 공유 풀 작업 안에서 호출되므로 여기서 풀을 또 만들지 않음
+    # (동시 요청 수가 MAX_WORKERS를 넘지 않게; 대부분은 배치 하나)
+    pr_stats = {}
+    for i in range(0, len(pr_numbers), GRAPHQL_BATCH_SIZE):
+        pr_stats.update(fetch_pr_stats_batch(repo_name, pr_numbers[i:i + GRAPHQL_BATCH_SIZE]))
+    return pr_stats
+
+@lru_cache(maxsize=4096)
+def _parse_gh_ts(timestamp):
+    """Parse a GitHub 'YYYY-MM-DDTHH:MM:SSZ' timestamp (much faster than strptime)."""
+    # 'Z'를 뗀 앞 19자리는 fromisoformat(C 구현)이 바로 읽음 (3.11 미만에서도 동작)
+    return datetime.fromisoformat(timestamp[:19])
 
 def calculate_merge_time(created_at, closed_at):
-    """Calculate the time taken to merge a PR."""
+    """Calculate the time taken to merge a PR from parsed datetimes."""
     if created_at and closed_at:
-        created_time = datetime.strptime(created_at, "%Y-%m-%dT%H:%M:%SZ")
-        closed_time = datetime.strptime(closed_at, "%Y-%m-%dT%H:%M:%SZ")
-        return (closed_time - created_time).days
+        return (closed_at - created_at).days
     return 'N/A'
 
-def extract_data_from_prs(prs, repo_name, user_id, start_date=None, end_date=None):
+def index_prs_by_author(prs):
+    """Group PRs by their author's user ID, keeping the newest-first list order."""
+    by_author = defaultdict(list)
+    for pr in prs:
+        author = pr['user'] or {}  # 탈퇴한 사용자의 PR은 user가 null
+        by_author[author.get('id')].append(pr)
+    return by_author
+
+def extract_data_from_prs(prs, repo_name, start_date=None, end_date=None):
     """
     Extract relevant PR data and include merge/cancel status, filtering by date range.
     
     Args:
-        prs (list): List of PRs.
+        prs (list): PRs created by the target contributor, newest first (see index_prs_by_author).
         repo_name (str): Repository name.
-        user_id (int): Target user ID.
         start_date (str): Start date in 'YYYY-MM-DD' format (inclusive).
         end_date (str): End date in 'YYYY-MM-DD' format (inclusive).
 
@@ -200,136 +531,161 @@ def extract_data_from_prs(prs, repo_name, user_id, start_date=None, end_date=Non
     """
     data = []
 
-    # Parse the date range
-    start_date = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
-    end_date = datetime.strptime(end_date, "%Y-%m-%d") if end_date else None
-
-    for pr in prs:
-        # Check if the PR is created by the contributor (user_id)
-        if pr['user']['id'] == user_id:
-            created_at = datetime.strptime(pr['created_at'], "%Y-%m-%dT%H:%M:%SZ")  # PR creation time
-            
-            # Filter by date range
-            if (start_date and created_at < start_date) or (end_date and created_at > end_date):
-                continue  # Skip PRs outside the date range
-
-            pr_title = pr['title']
-            pr_number = pr['number']
-            pr_link = pr['html_url']
-            closed_at_raw = pr['closed_at']
-            closed_at = (
-                datetime.strptime(closed_at_raw, "%Y-%m-%dT%H:%M:%SZ").strftime("%Y-%m-%d %H:%M:%S")
-                if closed_at_raw
-                else None
-            )
-            merged_at = pr['merged_at']
-
-            merge_status = 'Merged' if merged_at else ('Cancelled' if closed_at_raw else 'Open')
-            time_to_merge = calculate_merge_time(pr['created_at'], closed_at_raw)
-            total_changes = get_pr_details(repo_name, pr_number)
-
-            data.append([
-                repo_name, pr_title, pr_number, pr_link,
-                created_at.strftime("%Y-%m-%d %H:%M:%S"), closed_at,
-                time_to_merge, total_changes, merge_status
-            ])
+    # GitHub 시각은 고정 길이 'YYYY-MM-DDTHH:MM:SSZ'라서 문자열 비교 = 시각 비교
+    # -> 기간 밖의 PR은 날짜 파싱 없이 걸러냄
+    start_ts = f"{start_date}T00:00:00Z" if start_date else None
+    end_ts = f"{end_date}T23:59:59Z" if end_date else None  # 종료일 당일에 생성된 PR까지 포함
+
+    # 목록이 생성일 내림차순이라 기간 안의 PR은 연속된 한 구간
+    # -> 종료일 이후 PR은 건너뛰고, 시작일 이전 PR이 처음 나오면 나머지는 보지 않음
+    prs_in_range = iter(prs)
+    if end_ts:
+        prs_in_range = dropwhile(lambda pr: pr['created_at'] > end_ts, prs_in_range)
+    if start_ts:
+        prs_in_range = takewhile(lambda pr: pr['created_at'] >= start_ts, prs_in_range)
+
+    eligible_prs = [(pr, _parse_gh_ts(pr['created_at'])) for pr in prs_in_range]  # PR creation time
+
+    # LOC는 PR마다 따로 요청하지 않고 GraphQL로 한 번에 조회
+    pr_stats = fetch_pr_stats_graphql(repo_name, [pr['number'] for pr, _ in eligible_prs])
+
+    for pr, created_at in eligible_prs:
+        pr_title = pr['title']
+        pr_number = pr['number']
+        pr_link = pr['html_url']
+        closed_at_raw = pr['closed_at']
+        closed_time = _parse_gh_ts(closed_at_raw) if closed_at_raw else None
+        merged_at = pr['merged_at']
+
+        merge_status = 'Merged' if merged_at else ('Cancelled' if closed_at_raw else 'Open')
+        time_to_merge = calculate_merge_time(created_at, closed_time)
+        total_changes = pr_stats.get(pr_number, 'N/A')
+
+        data.append([
+            repo_name, pr_title, pr_number, pr_link,
+            created_at, closed_time,  # 문자열로 바꾸지 않고 datetime 그대로 (엑셀 날짜 서식으로 표시)
+            time_to_merge, total_changes, merge_status
+        ])
 
     return data
 
 def save_to_excel(data, output_path):
     """Save PR data to an Excel file with PR Number next to PR Title and hyperlinks on PR Number."""
-    print("\nSaving data to Excel...")
+    logger.info("\nSaving data to Excel...")
 
     try:
-        # Add the 'No.' column by adding index numbers to the data
-        numbered_data = [[i + 1] + row[:3] + row[4:] for i, row in enumerate(data)]
-        
         # Verify data structure
         if data:
-            print(f"Sample row: {data[0]} (Length: {len(data[0])})")
-
-        # Create DataFrame with added 'No.' column
-        df = pd.DataFrame(
-            numbered_data, 
-            columns = ['No.', 'Repository', 'PR Title',
-                     'PR No.', 'PR Open Time', 'PR Close Time',
-                     'Merge days', 'LOC', 'PR Status']
-        )
-
-        # Reorder columns to place PR Number next to PR Title
-        column_order = ['No.', 'Repository', 'PR Title',
-                     'PR No.', 'PR Open Time', 'PR Close Time',
-                     'Merge days', 'LOC', 'PR Status']
-        
-        if not all(col in df.columns for col in column_order):
-            print(f"Invalid column names in column_order: {column_order}. DataFrame columns: {df.columns}")
-            return
-        df = df[column_order]
-
-        # Write DataFrame to Excel
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='PR List')
-            wb = writer.book
-            ws = wb['PR List']
-
-            # Add hyperlinks to the 'Number' column
-            for row in range(2, len(df) + 2):
-                pr_number_cell = ws.cell(row=row, column=4)
-                pr_number_cell.value = f"#{data[row-2][2]}"
-                pr_number_cell.hyperlink = data[row-2][3]
-                pr_number_cell.style = 'Hyperlink'  # Apply hyperlink style
-            
-            # Auto-adjust column widths # 이거 다시 봐야됨
-            MAX_COLUMN_WIDTH = 80
-            for col in ws.columns:
-                max_length = 0
-                col_letter = get_column_letter(col[0].column)  # Get the column letter
-                for cell in col:
-                    try:
-                        if cell.value:
-                            max_length = max(max_length, len(str(cell.value)))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, MAX_COLUMN_WIDTH)  # Add some padding
-                ws.column_dimensions[col_letter].width = adjusted_width
-
-            # Apply alignment to each cell
-            for row in ws.iter_rows(min_row=2, max_row=len(df)+1, min_col=1, max_col=len(df.columns)):
-                for cell in row:
-                    if cell.column in (1, 4, 5, 6, 7, 8, 9):
-                        cell.alignment = Alignment(horizontal='center')
-                    elif cell.column in (2, 3):
-                        cell.alignment = Alignment(horizontal='left')
-                    else:
-                        cell.alignment = Alignment(horizontal='right')
-
-        print(f"PR list has been saved to '{output_path}' with hyperlinks on PR Number.")
+            logger.debug(f"Sample row: {data[0]} (Length: {len(data[0])})")
+
+        # write-only 모드: 셀 전체를 메모리에 올리지 않고 행 단위로 바로 기록
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet('PR List')
+
+        # 열 폭은 행을 만들면서 같이 계산 (저장 후 셀을 다시 훑지 않음)
+        col_widths = [len(column_name) for column_name in COLUMNS]
+        rows = []
+        for i, row in enumerate(data):
+            repo_name, pr_title, pr_number, pr_link = row[:4]
+            # Add the 'No.' column and drop the PR link (it becomes the hyperlink)
+            values = [i + 1, repo_name, pr_title, f"#{pr_number}"] + row[4:]
+            for column, value in enumerate(values):
+                if value is not None:
+                    col_widths[column] = max(col_widths[column], len(str(value)))
+            rows.append((values, pr_link))
+
+        # write-only 시트는 첫 행을 쓰기 전에 열 폭이 정해져 있어야 함
+        for i, width in enumerate(col_widths, start=1):
+            ws.column_dimensions[get_column_letter(i)].width = min(width + 2, MAX_COLUMN_WIDTH)  # Add some padding
+
+        header_cells = []
+        for column_name in COLUMNS:
+            cell = WriteOnlyCell(ws, value=column_name)
+            cell.font = HEADER_FONT
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        for values, pr_link in rows:
+            cells = []
+            for value, style in zip(values, COLUMN_STYLES):
+                if value is None:
+                    cells.append(None)  # 빈 칸(미종료 PR의 Close Time)은 셀 객체 없이 건너뜀
+                    continue
+                cell = WriteOnlyCell(ws, value=value)
+                cell.style = style
+                cells.append(cell)
+            cells[3].hyperlink = pr_link
+            ws.append(cells)
+
+        wb.save(output_path)
+        logger.info(f"PR list has been saved to '{output_path}' with hyperlinks on PR Number.")
     except PermissionError:
-        print(f"Permission Error: Unable to write to '{output_path}'. File might be open.")
+        logger.error(f"Permission Error: Unable to write to '{output_path}'. File might be open.")
     except Exception as e:
-        print(f"An unexpected error occurred while saving Excel: {e}")
+        logger.error(f"An unexpected error occurred while saving Excel: {e}")
 
 def get_pr_count(repo_name):
     """Check the number of PRs in a repository using Issues API."""
-    ensure_rate_limit()
+    logger.debug(f"Checking PR count for repository '{repo_name}'...")
     url = f'https://api.github.com/search/issues?q=repo:AdvancedTechnologyInc/{repo_name}+is:pr'
+    repo_cache = get_repo_cache(repo_name)
+    if 'count' in repo_cache and time.time() - repo_cache.get('count_checked_at', 0) < PR_COUNT_MAX_AGE:
+        return repo_cache['count']
+    request_headers = {}
+    if repo_cache.get('count_etag'):
+        request_headers['If-None-Match'] = repo_cache['count_etag']
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = github_request('GET', url, resource='search', headers=request_headers, timeout=10)
+        if response.status_code == 304:
+            update_repo_cache(repo_name, count_checked_at=time.time())
+            return repo_cache['count']
         response.raise_for_status()
 
-        #check remaining rate limit
-        remaining_limit = int(response.headers.get('X-RateLimit-Remaining', 1))
-        if remaining_limit < 5:
-            reset_time = int(response.headers.get('X-RateLimit-Reset', time.time()))
-            sleep_duration = max(0, reset_time - int(time.time()))
-            print(f"Rate limit nearing. Sleeping for {sleep_duration} seconds...")
-            time.sleep(sleep_duration + 1)
-
-        data = response.json()
-        return data.get('total_count', 0)  # Total number of PRs
+        data = parse_json(response)
+        pr_count = data.get('total_count', 0)  # Total number of PRs
+        update_repo_cache(repo_name, count=pr_count, count_etag=response.headers.get('ETag'),
+                          count_checked_at=time.time())
+        return pr_count
     except RequestException as e:
-        print(f"Error checking PR count for repository '{repo_name}': {e}")
-        return 0
+        logger.error(f"Error checking PR count for repository '{repo_name}': {e}")
+        # 확인에 실패했으면 저장된 개수라도 사용 (0을 돌려주면 저장소가 보고서에서 빠짐)
+        return repo_cache.get('count', 0)
+
+def search_pr_repositories(login, start_date=None, end_date=None):
+    """Return the names of repositories where a user created PRs in the date range, or None if unknown."""
+    logger.debug(f"Searching repositories with PRs by '{login}'...")
+    query = f'org:AdvancedTechnologyInc is:pr author:{login}'
+    if start_date or end_date:
+        query += f' created:{start_date or "*"}..{end_date or "*"}'
+    url = 'https://api.github.com/search/issues'
+    params = {'q': query, 'per_page': 100}
+    repo_names = set()
+    try:
+        while url:
+            response = github_request('GET', url, resource='search', params=params, timeout=10)
+            response.raise_for_status()
+            data = parse_json(response)
+            # 검색 결과는 최대 1000건까지만 주므로 잘리면 저장소 목록을 믿을 수 없음
+            if data.get('incomplete_results') or data.get('total_count', 0) > 1000:
+                return None
+            for item in data.get('items', []):
+                repo_names.add(item['repository_url'].rsplit('/', 1)[-1])
+            # 다음 페이지 URL에는 쿼리가 이미 들어 있음
+            url = response.links.get('next', {}).get('url')
+            params = None
+    except RequestException as e:
+        logger.error(f"Error searching PRs by '{login}': {e}")
+        return None
+    return repo_names
+
+def setup_logging(level=logging.INFO):
+    """Send log records through a queue so worker threads never block on stdout."""
+    log_queue = queue.Queue(-1)
+    logging.basicConfig(level=level, format='%(message)s', handlers=[QueueHandler(log_queue)])
+    # 실제 출력은 별도 스레드에서 처리
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    listener.start()
+    return listener
 
 def main():
     # Excel settings
@@ -351,52 +707,97 @@ def main():
     # Step 3: Fetch contributors from Excel sheet
     contributors = get_contributors_from_excel(repo_excel_path, contributor_sheet_name, contributor_column_letter)
 
-    # 사용자 ID 캐시용 딕셔너리
-    user_ids = {}
+    # 기여자 ID는 GraphQL로 한 번에 조회
+    user_ids = get_user_ids(contributors)
 
-    # Step 4: Fetch PRs and extract data for each contributor
+    # 기여자별 검색 한 번으로 기간 내 PR이 있는 저장소만 남김 (검색이 실패하면 전체 저장소를 그대로 사용)
+    active_repo_names = set()
     for contributor in contributors:
-        print(f"Processing PRs for contributor '{contributor}' across all repositories...")
-        
-        # 기여자별 PR 데이터를 누적할 리스트
-        contributor_data = []
-
-        # 기여자 ID 캐시에서 확인
-        if contributor not in user_ids:
-            user_id = get_user_id(contributor)
-            if user_id:
-                user_ids[contributor] = user_id
-            else:
-                print(f"Skipping contributor '{contributor}' due to missing user ID.")
-                continue  # 사용자 ID를 못 얻으면 다음으로 넘어감
+        if user_ids.get(contributor) is None:
+            continue
+        repo_names = search_pr_repositories(contributor, start_date, end_date)
+        if repo_names is None:
+            active_repo_names = None
+            break
+        active_repo_names.update(name.lower() for name in repo_names)
+    if active_repo_names is not None:
+        repos = [repo_name for repo_name in repos if repo_name.lower() in active_repo_names]
+
+    # Step 4: 저장소별 PR 목록은 기여자 수와 상관없이 한 번만 가져옴
+    # 기여자마다 전체 목록을 훑지 않도록 작성자 ID별로 미리 묶어둠
+    repos_with_prs = []
+    repos_to_fetch = []
+    repo_prs_by_author = {}
+    # 개수 확인은 캐시를 갱신하므로 그 전에 캐시 상태를 먼저 읽어둠
+    repo_caches = {repo_name: get_repo_cache(repo_name) for repo_name in repos}
+    # PR 개수 확인도 저장소별로 동시에 (변경 없으면 304, rate limit 차감 없음)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        pr_counts = dict(zip(repos, executor.map(get_pr_count, repos)))
+
+    for repo_name in repos:
+        repo_cache = repo_caches[repo_name]
+        pr_count = pr_counts[repo_name]
+
+        if pr_count == 0:
+            logger.info(f"No PRs found in repository '{repo_name}'. Skipping...\n")
+            continue
+        repos_with_prs.append(repo_name)
+
+        # PR 개수가 그대로이고 최근에 받은 목록이 있으면 목록 요청 자체를 생략
+        if is_pr_list_fresh(repo_cache, pr_count, start_date):
+            logger.info(f"PR list for repository '{repo_name}' is unchanged. Using cached PRs.")
+            repo_prs_by_author[repo_name] = index_prs_by_author(get_cached_prs(repo_cache))
         else:
-            user_id = user_ids[contributor]  # 캐시된 사용자 ID 사용
-
-        # 모든 저장소에 대해 PR 데이터 처리
-        for repo_name in repos:
-            print(f"Checking PR count for repository '{repo_name}'...")
-            if repo_name in pr_cache:
-                pr_count = get_pr_count(repo_name)
-            else:
-                pr_count = get_pr_count(repo_name)
-                pr_cache[repo_name] = pr_count
-                save_cache(pr_cache)
-
-            if pr_count == 0:
-                print(f"No PRs found in repository '{repo_name}'. Skipping...\n")
+            repos_to_fetch.append(repo_name)
+
+    # 나머지 저장소만 동시에 가져옴
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(get_prs_for_repository, repo_name, start_date, pr_counts[repo_name]): repo_name for repo_name in repos_to_fetch}
+        for future in as_completed(futures):
+            repo_prs_by_author[futures[future]] = index_prs_by_author(future.result())
+
+    # Step 5: 가져온 목록에서 기여자별 PR 데이터 추출
+    # 모든 기여자의 작업을 한 풀에 미리 넣어서, 앞 기여자를 저장하는 동안에도 다음 기여자의 LOC 조회가 진행됨
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        contributor_futures = {}
+        for contributor in contributors:
+            user_id = user_ids.get(contributor)
+            if not user_id:
+                contributor_futures[contributor] = None
                 continue
+            # 이 기여자의 PR이 있는 저장소만, 엑셀 목록 순서대로
+            contributor_futures[contributor] = [
+                executor.submit(extract_data_from_prs, repo_prs_by_author[repo_name][user_id],
+                                repo_name, start_date, end_date)
+                for repo_name in repos_with_prs if user_id in repo_prs_by_author[repo_name]
+            ]
+
+        for contributor, futures in contributor_futures.items():
+            logger.info(f"Processing PRs for contributor '{contributor}' across all repositories...")
+
+            if futures is None:
+                logger.warning(f"Skipping contributor '{contributor}' due to missing user ID.")
+                continue  # 사용자 ID를 못 얻으면 다음으로 넘어감
 
-            # PR이 있는 경우에만 데이터를 가져옴
-            prs = get_prs_for_repository(repo_name)
-            repo_contributor_data = extract_data_from_prs(prs, repo_name, user_id, start_date, end_date)
-            contributor_data.extend(repo_contributor_data)
+            # 기여자별 PR 데이터를 누적할 리스트
+            contributor_data = []
+            for future in futures:
+                contributor_data.extend(future.result())
 
-        # Step 5: 기여자의 모든 데이터를 Excel에 저장
-        if contributor_data:
-            output_path = f'{contributor}_pr_list.xlsx'
-            save_to_excel(contributor_data, output_path)
-        else:
-            print(f"No PR data found for contributor '{contributor}' in any repository.")
+            # Step 6: 기여자의 모든 데이터를 Excel에 저장
+            if contributor_data:
+                output_path = f'{contributor}_pr_list.xlsx'
+                save_to_excel(contributor_data, output_path)
+            else:
+                logger.info(f"No PR data found for contributor '{contributor}' in any repository.")
+
+            # 기여자 단위로 캐시를 디스크에 반영
+            with cache_lock:
+                pr_cache.sync()
 
 if __name__ == '__main__':
-    main()
+    log_listener = setup_logging()
+    try:
+        main()
+    finally:
+        log_listener.stop()  # 큐에 남은 로그를 모두 출력